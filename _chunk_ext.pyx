@@ -0,0 +1,69 @@
+# cython: boundscheck=False, wraparound=False
+"""Optional C accelerator for the brute-force chunk scan.
+
+Mirrors the Gray-code walk of bruteforce._process_chunk_jit for
+environments without numba. Build in place with:
+
+    python setup.py build_ext --inplace
+"""
+
+cimport numpy as cnp
+
+
+def scan_chunk(long long start, long long end,
+               cnp.int64_t[::1] costs, cnp.float64_t[::1] profits,
+               long long budget, long long k_max):
+    """Scan combinations [start, end) in Gray-code order.
+
+    Args:
+        start: First combination index (inclusive).
+        end: Last combination index (exclusive).
+        costs: Cost of each action, indexed by bit position.
+        profits: Profit of each action, indexed by bit position.
+        budget: Maximum budget available.
+        k_max: Largest feasible subset size.
+
+    Returns:
+        tuple: Best profit, its cost, and its bitmask.
+    """
+    cdef long long n = costs.shape[0]
+    cdef long long g, i, j, t, flip
+    cdef long long cost = 0, count = 0
+    cdef double profit = 0.0, best_profit = 0.0
+    cdef long long best_cost = 0, best_mask = 0
+
+    # Seed the running totals from the first Gray code
+    g = start ^ (start >> 1)
+    for j in range(n):
+        if g & (<long long>1 << j):
+            cost += costs[j]
+            profit += profits[j]
+            count += 1
+    if count <= k_max and cost <= budget and profit > 0.0:
+        best_profit = profit
+        best_cost = cost
+        best_mask = g
+
+    for i in range(start + 1, end):
+        # The flipped bit is the lowest set bit of i
+        flip = i & -i
+        j = 0
+        t = flip
+        while t > 1:
+            t >>= 1
+            j += 1
+        g ^= flip
+        if g & flip:
+            cost += costs[j]
+            profit += profits[j]
+            count += 1
+        else:
+            cost -= costs[j]
+            profit -= profits[j]
+            count -= 1
+        if count <= k_max and cost <= budget and profit > best_profit:
+            best_profit = profit
+            best_cost = cost
+            best_mask = g
+
+    return best_profit, best_cost, best_mask
@@ -1,5 +1,66 @@
 import csv
+import multiprocessing
 import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import _chunk_ext
+    EXT_AVAILABLE = True
+except ImportError:
+    EXT_AVAILABLE = False
+
+CHUNK_SIZE = 1 << 16
+NUM_STRIPES = 64
+POOL_CHUNKSIZE = 4
+
+# De Bruijn multiply table: maps an isolated low bit (i & -i) to its bit
+# index in O(1), standing in for a ctz instruction inside the kernel.
+_DEBRUIJN64 = np.uint64(0x03F79D71B4CB0A89)
+_DEBRUIJN_TABLE = np.zeros(64, dtype=np.int64)
+for _j in range(64):
+    _DEBRUIJN_TABLE[(((1 << _j) * 0x03F79D71B4CB0A89) & 0xFFFFFFFFFFFFFFFF) >> 58] = _j
+del _j
+
+
+def _parse_actions(csvfile) -> list[dict[str, float]]:
+    """Parse action rows from an open CSV file.
+
+    Resolves the column positions from the header once, then indexes each
+    row directly instead of building a dict per row.
+
+    Args:
+        csvfile: Open CSV file object.
+
+    Returns:
+        list[dict[str, float]]: List of actions with name, cost, and profit.
+    """
+    actions = []
+    reader = csv.reader(csvfile)
+    header = next(reader, None)
+    if header is None:
+        return actions
+    name_col = header.index("Actions #")
+    cost_col = header.index("Coût par action (en euros)")
+    benefit_col = header.index("Bénéfice (après 2 ans)")
+    for row in reader:
+        if not row:
+            continue
+        cost = int(row[cost_col])
+        benefit = float(row[benefit_col].replace("%", "")) / 100
+        actions.append({
+            "name": row[name_col],
+            "cost": cost,
+            "profit": cost * benefit
+        })
+    return actions
 
 
 def load_actions_from_csv(file_path: str) -> list[dict[str, float]]:
@@ -11,34 +72,308 @@ def load_actions_from_csv(file_path: str) -> list[dict[str, float]]:
     Returns:
         list[dict[str, float]]: List of actions with name, cost, and profit.
     """
-    actions = []
     try:
         with open(file_path, newline="", encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                cost = int(row["Coût par action (en euros)"])
-                benefit = float(row["Bénéfice (après 2 ans)"].replace("%", "")) / 100
-                actions.append({
-                    "name": row["Actions #"],
-                    "cost": cost,
-                    "profit": cost * benefit
-                })
+            return _parse_actions(csvfile)
     except FileNotFoundError:
         print(f"Error: File {file_path} not found.")
         exit(1)
     except UnicodeDecodeError:
         print("Error: File encoding issue. Trying with 'latin-1'...")
         with open(file_path, newline="", encoding="latin-1") as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                cost = int(row["Coût par action (en euros)"])
-                benefit = float(row["Bénéfice (après 2 ans)"].replace("%", "")) / 100
-                actions.append({
-                    "name": row["Actions #"],
-                    "cost": cost,
-                    "profit": cost * benefit
-                })
-    return actions
+            return _parse_actions(csvfile)
+
+
+def _drop_dominated(actions: list[dict[str, float]], budget: int) -> list[dict[str, float]]:
+    """Drop actions that no best combination can include.
+
+    Pairwise dominance cannot remove items from a 0/1 search (a dominated
+    action may still sit in the optimum next to its dominator), so the
+    filter keeps to actions dominated by the empty selection: dearer than
+    the whole budget, or with non-positive profit. Every action dropped
+    halves the search space.
+
+    Args:
+        actions (list[dict[str, float]]): List of actions with name, cost, and profit.
+        budget (int): Maximum budget available.
+
+    Returns:
+        list[dict[str, float]]: Actions that can still appear in an optimum.
+    """
+    return [a for a in actions if a["cost"] <= budget and a["profit"] > 0]
+
+
+def _max_affordable_actions(costs: np.ndarray, budget: int) -> int:
+    """Count how many actions can fit in the budget at best.
+
+    Partial sums of the sorted costs: once the k cheapest actions already
+    exceed the budget, no subset of k or more actions is feasible.
+
+    Args:
+        costs (np.ndarray): Cost of each action.
+        budget (int): Maximum budget available.
+
+    Returns:
+        int: Largest feasible subset size.
+    """
+    running = 0
+    k_max = 0
+    for cost in np.sort(costs):
+        running += int(cost)
+        if running > budget:
+            break
+        k_max += 1
+    return k_max
+
+
+def _process_chunk_jit(start, end, costs, profits, budget, k_max):
+    """Compiled Gray-code scan of combinations [start, end), one thread per stripe.
+
+    Walking each stripe in Gray-code order means consecutive combinations
+    differ by exactly one action, so every step updates the running cost
+    and profit in O(1) instead of re-summing all n bits.
+    """
+    size = end - start
+    n_stripes = min(size, NUM_STRIPES)
+    stripe = (size + n_stripes - 1) // n_stripes
+    best_profits = np.zeros(n_stripes, dtype=np.float64)
+    best_costs = np.zeros(n_stripes, dtype=np.int64)
+    best_masks = np.zeros(n_stripes, dtype=np.int64)
+
+    for s in prange(n_stripes):
+        lo = start + s * stripe
+        hi = min(lo + stripe, end)
+        if lo >= hi:
+            continue
+
+        # Seed the running totals from the stripe's first Gray code,
+        # visiting only its set bits
+        g = lo ^ (lo >> 1)
+        cost = 0
+        profit = 0.0
+        count = 0
+        m = g
+        while m:
+            flip = m & -m
+            j = _DEBRUIJN_TABLE[(np.uint64(flip) * _DEBRUIJN64) >> np.uint64(58)]
+            cost += costs[j]
+            profit += profits[j]
+            count += 1
+            m ^= flip
+
+        best_profit = 0.0
+        best_cost = 0
+        best_mask = 0
+        if count <= k_max and cost <= budget and profit > 0.0:
+            best_profit = profit
+            best_cost = cost
+            best_mask = g
+
+        for i in range(lo + 1, hi):
+            # The bit flipped between gray(i - 1) and gray(i) is the
+            # lowest set bit of i, isolated as i & -i and mapped to its
+            # index through the De Bruijn table instead of a shift loop
+            flip = i & -i
+            j = _DEBRUIJN_TABLE[(np.uint64(flip) * _DEBRUIJN64) >> np.uint64(58)]
+            g ^= flip
+            if g & flip:
+                cost += costs[j]
+                profit += profits[j]
+                count += 1
+            else:
+                cost -= costs[j]
+                profit -= profits[j]
+                count -= 1
+            # Oversized subsets can never fit: cheapest k_max + 1 costs
+            # already exceed the budget
+            if count <= k_max and cost <= budget and profit > best_profit:
+                best_profit = profit
+                best_cost = cost
+                best_mask = g
+
+        best_profits[s] = best_profit
+        best_costs[s] = best_cost
+        best_masks[s] = best_mask
+
+    best = np.argmax(best_profits)
+    if best_profits[best] <= 0.0:
+        return 0.0, 0, 0
+    return best_profits[best], best_costs[best], best_masks[best]
+
+
+if NUMBA_AVAILABLE:
+    # cache=True keeps the compiled kernel on disk so only the first ever
+    # run pays the JIT compilation cost.
+    _process_chunk_jit = njit(parallel=True, fastmath=True, cache=True)(_process_chunk_jit)
+
+
+def _fractional_upper_bound(capacity: int, sorted_costs: list[int],
+                            sorted_profits: list[float]) -> float:
+    """Upper-bound the profit attainable from actions within a capacity.
+
+    Relaxes the problem to the fractional knapsack: actions (sorted by
+    decreasing profit density) are taken whole while they fit, then the
+    first one that does not fit is taken fractionally. No 0/1 selection
+    can ever beat this bound.
+
+    Args:
+        capacity (int): Remaining budget.
+        sorted_costs (list[int]): Action costs, sorted by decreasing density.
+        sorted_profits (list[float]): Matching profits, same order.
+
+    Returns:
+        float: Upper bound on the achievable profit.
+    """
+    bound = 0.0
+    for cost, profit in zip(sorted_costs, sorted_profits):
+        if capacity <= 0:
+            break
+        if cost <= capacity:
+            capacity -= cost
+            bound += profit
+        else:
+            bound += profit * capacity / cost
+            break
+    return bound
+
+
+def _compile_fixed_part(costs: np.ndarray, profits: np.ndarray, low_bits: int):
+    """Generate a chunk fixed-part evaluator specialized to these actions.
+
+    exec-compiles a straight-line function for the current n: every high
+    bit becomes one `if` with that action's cost and profit baked in as
+    constants, replacing the generic per-bit walk and its array lookups.
+
+    Args:
+        costs (np.ndarray): Cost of each action, indexed by bit position.
+        profits (np.ndarray): Profit of each action, indexed by bit position.
+        low_bits (int): Number of free low bits in the chunk.
+
+    Returns:
+        Callable[[int], tuple[int, float]]: high bits -> (cost, profit) of
+        the fixed part.
+    """
+    lines = [
+        "def fixed_part(high):",
+        "    cost = 0",
+        "    profit = 0.0",
+    ]
+    for j in range(low_bits, len(costs)):
+        lines.append(f"    if high & {1 << (j - low_bits)}:")
+        lines.append(f"        cost += {int(costs[j])}")
+        lines.append(f"        profit += {float(profits[j])!r}")
+    lines.append("    return cost, profit")
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["fixed_part"]
+
+
+def _chunk_upper_bound(start: int, fixed_part, budget: int, low_bits: int,
+                       free_costs: list[int], free_profits: list[float]) -> float:
+    """Upper-bound the profit reachable inside the chunk starting at start.
+
+    The chunk fixes the bitmask's high bits; the bound is the fixed part
+    plus the fractional relaxation of the free (low-bit) actions, or -1.0
+    when the fixed part alone busts the budget.
+
+    Args:
+        start (int): First combination index of the chunk.
+        fixed_part: Specialized evaluator from _compile_fixed_part.
+        budget (int): Maximum budget available.
+        low_bits (int): Number of free low bits in the chunk.
+        free_costs (list[int]): Free-action costs, sorted by decreasing density.
+        free_profits (list[float]): Matching free-action profits, same order.
+
+    Returns:
+        float: Upper bound on the chunk's best profit (-1.0 if infeasible).
+    """
+    # The jitted and C kernels visit gray(i), the NumPy fallback visits i
+    # itself; either way the bits above low_bits are constant over the chunk.
+    gray_scan = NUMBA_AVAILABLE or EXT_AVAILABLE
+    high = (start ^ (start >> 1) if gray_scan else start) >> low_bits
+    fixed_cost, fixed_profit = fixed_part(high)
+
+    if fixed_cost > budget:
+        return -1.0
+    return fixed_profit + _fractional_upper_bound(budget - fixed_cost, free_costs, free_profits)
+
+
+# Worker-side views on the shared SoA arrays, set up by _init_worker
+_worker_arrays = None
+
+
+def _init_worker(costs_name: str, profits_name: str, n: int) -> None:
+    """Attach this worker to the shared cost/profit arrays, once per process."""
+    global _worker_arrays
+    shm_costs = shared_memory.SharedMemory(name=costs_name)
+    shm_profits = shared_memory.SharedMemory(name=profits_name)
+    costs = np.ndarray((n,), dtype=np.int64, buffer=shm_costs.buf)
+    profits = np.ndarray((n,), dtype=np.float64, buffer=shm_profits.buf)
+    # Keep the SharedMemory objects alive alongside the views, or their
+    # buffers would be released when this function returns.
+    _worker_arrays = (costs, profits, shm_costs, shm_profits)
+
+
+def _process_chunk_star(args: tuple) -> tuple[float, int, int]:
+    """Run one chunk task against the shared arrays for Pool.imap_unordered."""
+    start, end, budget = args
+    costs, profits = _worker_arrays[0], _worker_arrays[1]
+    return process_chunk(start, end, costs, profits, budget)
+
+
+def process_chunk(start: int, end: int, costs: np.ndarray, profits: np.ndarray,
+                  budget: int) -> tuple[float, int, int]:
+    """Scan combinations [start, end) and return the best one within budget.
+
+    Args:
+        start (int): First combination bitmask (inclusive).
+        end (int): Last combination bitmask (exclusive).
+        costs (np.ndarray): Cost of each action, indexed by bit position.
+        profits (np.ndarray): Profit of each action, indexed by bit position.
+        budget (int): Maximum budget available.
+
+    Returns:
+        tuple[float, int, int]: Best profit, its cost, and its bitmask.
+    """
+    k_max = _max_affordable_actions(costs, budget)
+
+    if NUMBA_AVAILABLE:
+        profit, cost, mask = _process_chunk_jit(start, end, costs, profits, budget, k_max)
+        return float(profit), int(cost), int(mask)
+
+    if EXT_AVAILABLE:
+        profit, cost, mask = _chunk_ext.scan_chunk(start, end, costs, profits, budget, k_max)
+        return float(profit), int(cost), int(mask)
+
+    n = len(costs)
+
+    # NumPy fallback: broadcast every bitmask of the chunk against every
+    # bit position at once: bits[i, j] is 1 when combination i includes
+    # action j.
+    masks = np.arange(start, end, dtype=np.uint64)
+    bits = ((masks[:, None] >> np.arange(n, dtype=np.uint64)) & np.uint64(1)).astype(np.int64)
+
+    # Cost-infeasible subset sizes are known up front: drop any row with
+    # more actions than the cheapest k_max can squeeze into the budget.
+    # Only worth the row copy when the cap bites on most masks, i.e.
+    # when it is below the average subset size n / 2.
+    if k_max < n // 2:
+        feasible = bits.sum(axis=1) <= k_max
+        if not feasible.any():
+            return 0.0, 0, 0
+        masks = masks[feasible]
+        bits = bits[feasible]
+
+    chunk_costs = bits @ costs
+    chunk_profits = bits @ profits
+
+    # Keep only combinations within budget and take the most profitable one
+    chunk_profits = np.where(chunk_costs <= budget, chunk_profits, -1.0)
+    best = int(np.argmax(chunk_profits))
+    if chunk_profits[best] <= 0.0:
+        return 0.0, 0, 0
+
+    return float(chunk_profits[best]), int(chunk_costs[best]), int(masks[best])
 
 
 def brute_force_investment(actions: list[dict[str, float]], budget: int = 500) -> tuple[list[str], int, float]:
@@ -51,31 +386,90 @@ def brute_force_investment(actions: list[dict[str, float]], budget: int = 500) -
     Returns:
         tuple[list[str], int, float]: Selected action names, total cost, total profit.
     """
+    actions = _drop_dominated(actions, budget)
     n = len(actions)
-    best_profit = 0
-    best_combination = []
+    # Structure-of-arrays layout: one contiguous array per field instead of
+    # one dict per action, so the hot loop never touches Python dicts.
+    costs = np.array([action["cost"] for action in actions], dtype=np.int64)
+    profits = np.array([action["profit"] for action in actions], dtype=np.float64)
+
+    best_profit = 0.0
     best_cost = 0
+    best_mask = 0
+
+    # Each chunk fixes the high bits of the bitmask and leaves the low
+    # bits free, so it is one branch of a branch-and-bound tree: sort the
+    # free actions by profit density once, then prune any chunk whose
+    # fixed part plus the fractional-knapsack bound on the free part
+    # cannot beat the best combination found so far.
+    low_bits = min(n, CHUNK_SIZE.bit_length() - 1)
+    density_order = sorted(
+        range(low_bits),
+        key=lambda j: profits[j] / costs[j] if costs[j] else float("inf"),
+        reverse=True,
+    )
+    free_costs = [int(costs[j]) for j in density_order]
+    free_profits = [float(profits[j]) for j in density_order]
+    fixed_part = _compile_fixed_part(costs, profits, low_bits)
+
+    # Try all 2^n combinations, one chunk of bitmasks at a time
+    total = 2**n
+    if NUMBA_AVAILABLE or total <= CHUNK_SIZE:
+        # The jitted kernel already spreads each chunk across threads, so
+        # scan sequentially and let the incumbent prune as it grows.
+        for start in range(0, total, CHUNK_SIZE):
+            upper = _chunk_upper_bound(start, fixed_part, budget,
+                                       low_bits, free_costs, free_profits)
+            if upper <= best_profit:
+                continue
+            end = min(start + CHUNK_SIZE, total)
+            chunk_profit, chunk_cost, chunk_mask = process_chunk(start, end, costs, profits, budget)
+            if chunk_profit > best_profit:
+                best_profit = chunk_profit
+                best_cost = chunk_cost
+                best_mask = chunk_mask
+    else:
+        # Pure-Python path: fan the chunks out to worker processes. The
+        # task generator is consumed lazily, so it prunes against the
+        # freshest incumbent the result loop has seen.
+        def surviving_chunks():
+            for start in range(0, total, CHUNK_SIZE):
+                upper = _chunk_upper_bound(start, fixed_part, budget,
+                                           low_bits, free_costs, free_profits)
+                if upper > best_profit:
+                    yield start, min(start + CHUNK_SIZE, total), budget
 
-    # Try all 2^n combinations
-    for i in range(2**n):
-        current_combination = []
-        current_cost = 0
-        current_profit = 0
-
-        # Check each bit to decide which actions to include
-        for j in range(n):
-            if i & (1 << j):
-                current_combination.append(actions[j]["name"])
-                current_cost += actions[j]["cost"]
-                current_profit += actions[j]["profit"]
-
-        # Update the best combination if within budget and better profit
-        if current_cost <= budget and current_profit > best_profit:
-            best_profit = current_profit
-            best_combination = current_combination
-            best_cost = current_cost
-
-    return best_combination, best_cost, best_profit
+        # Publish the SoA arrays once through shared memory instead of
+        # pickling them into every task.
+        shm_costs = shared_memory.SharedMemory(create=True, size=costs.nbytes)
+        shm_profits = shared_memory.SharedMemory(create=True, size=profits.nbytes)
+        try:
+            np.ndarray(costs.shape, dtype=costs.dtype, buffer=shm_costs.buf)[:] = costs
+            np.ndarray(profits.shape, dtype=profits.dtype, buffer=shm_profits.buf)[:] = profits
+
+            with multiprocessing.Pool(initializer=_init_worker,
+                                      initargs=(shm_costs.name, shm_profits.name, n)) as pool:
+                results = pool.imap_unordered(_process_chunk_star, surviving_chunks(),
+                                              chunksize=POOL_CHUNKSIZE)
+                for chunk_profit, chunk_cost, chunk_mask in results:
+                    if chunk_profit > best_profit:
+                        best_profit = chunk_profit
+                        best_cost = chunk_cost
+                        best_mask = chunk_mask
+        finally:
+            shm_costs.close()
+            shm_costs.unlink()
+            shm_profits.close()
+            shm_profits.unlink()
+
+    # Decode the winning mask by walking its set bits
+    best_combination = []
+    mask = best_mask
+    while mask:
+        low = mask & -mask
+        best_combination.append(actions[low.bit_length() - 1]["name"])
+        mask ^= low
+    return best_combination, int(best_cost), best_profit
 
 
 def main():
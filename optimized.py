@@ -1,6 +1,21 @@
 import csv
 import time
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Cost-axis block size for the parallel sweep: 4096 int32 cells stay
+# well inside one core's L1 cache.
+DP_BLOCK = 1 << 12
+# Below this many cells the whole dp table sits in L1 (8192 x int32 =
+# 32 KB), where a plain in-place sweep beats snapshots and thread fan-out.
+L1_CELLS = 1 << 13
+
 
 def load_actions_from_csv(file_path: str) -> list[dict[str, float]]:
     """Load actions from a CSV file formatted with 'name', 'price', 'profit'.
@@ -14,14 +29,24 @@ def load_actions_from_csv(file_path: str) -> list[dict[str, float]]:
     actions = []
     try:
         with open(file_path, newline="", encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
+            reader = csv.reader(csvfile)
+            header = next(reader, None)
+            if header is None:
+                return actions
+            # Resolve column positions once instead of building a dict
+            # per row with DictReader
+            name_col = header.index("name")
+            price_col = header.index("price")
+            profit_col = header.index("profit")
             for row in reader:
+                if not row:
+                    continue
                 try:
-                    cost = float(row["price"])
-                    profit_percentage = float(row["profit"])
+                    cost = float(row[price_col])
+                    profit_percentage = float(row[profit_col])
                     if cost > 0 and profit_percentage > 0:
                         actions.append({
-                            "name": row["name"],
+                            "name": row[name_col],
                             "cost": int(cost * 100),
                             "profit_percentage": profit_percentage,
                             "profit": (cost * profit_percentage) / 100
@@ -38,6 +63,64 @@ def load_actions_from_csv(file_path: str) -> list[dict[str, float]]:
     return actions
 
 
+def _knapsack_kernel(costs, profits, budget_cents):
+    """Compiled 1D knapsack sweep over contiguous cost/profit arrays.
+
+    The action loop itself is a strict chain (each sweep needs the table
+    the previous action produced), so parallelism comes from inside one
+    action's update: the cost axis is cut into blocks and every block
+    reads the pre-action snapshot while writing its own cells, which
+    keeps the threads race-free.
+
+    Choices come back as one packed bit stream per action (cell w lives
+    in bit w & 7 of byte w >> 3), eight cells per byte of traffic.
+    DP_BLOCK is a multiple of 8, so parallel blocks never share a byte.
+    """
+    n = len(costs)
+    dp = np.zeros(budget_cents + 1, dtype=np.int32)
+    choices = np.zeros((n, (budget_cents >> 3) + 1), dtype=np.uint8)
+
+    if budget_cents < L1_CELLS:
+        # The whole table fits in L1: the plain backward in-place sweep
+        # needs no snapshot and no thread fan-out.
+        for idx in range(n):
+            cost = costs[idx]
+            profit = profits[idx]
+            for w in range(budget_cents, cost - 1, -1):
+                candidate = dp[w - cost] + profit
+                if candidate > dp[w]:
+                    dp[w] = candidate
+                    choices[idx, w >> 3] |= np.uint8(1 << (w & 7))
+        return dp, choices
+
+    prev = np.zeros(budget_cents + 1, dtype=np.int32)
+    n_blocks = (budget_cents + DP_BLOCK) // DP_BLOCK
+
+    for idx in range(n):
+        cost = costs[idx]
+        if cost > budget_cents:
+            continue
+        profit = profits[idx]
+        # Blocks only ever read prev[w - cost] for w <= budget, so the
+        # snapshot stops there; dear actions copy much less than the table
+        prev[:budget_cents + 1 - cost] = dp[:budget_cents + 1 - cost]
+        for block in prange(n_blocks):
+            w_start = max(block * DP_BLOCK, cost)
+            w_stop = min((block + 1) * DP_BLOCK, budget_cents + 1)
+            for w in range(w_start, w_stop):
+                candidate = prev[w - cost] + profit
+                if candidate > dp[w]:
+                    dp[w] = candidate
+                    choices[idx, w >> 3] |= np.uint8(1 << (w & 7))
+
+    return dp, choices
+
+
+if NUMBA_AVAILABLE:
+    # On-disk cache: repeat runs skip the JIT compilation entirely.
+    _knapsack_kernel = njit(parallel=True, cache=True)(_knapsack_kernel)
+
+
 def optimized_investment(actions: list[dict[str, float]], budget: int = 500) -> tuple[list[str], float, float]:
     """Find the best combination of actions using dynamic programming (1D DP).
 
@@ -49,22 +132,56 @@ def optimized_investment(actions: list[dict[str, float]], budget: int = 500) ->
         tuple[list[str], float, float]: Selected action names, total cost, total profit.
     """
     budget_cents = int(budget * 100)
-    dp = [0.0] * (budget_cents + 1)
-    included = [[] for _ in range(budget_cents + 1)]
-
-    for action in actions:
-        cost_cents = action["cost"]
-        profit_euros = action["profit"]
-        name = action["name"]
-        for w in range(budget_cents, cost_cents - 1, -1):
-            profit_with = dp[w - cost_cents] + profit_euros
-            if profit_with > dp[w]:
-                dp[w] = profit_with
-                included[w] = included[w - cost_cents] + [name]
-
-    selected_names = included[budget_cents]
-    total_cost = sum(a["cost"] / 100 for a in actions if a["name"] in selected_names)
-    total_profit = dp[budget_cents]
+    # Structure-of-arrays layout, as in bruteforce.py: contiguous arrays
+    # keep the kernel's memory walk linear. Profits are scored in int32
+    # cents: half the width of float64 scores, so the sweep moves half
+    # the bytes.
+    costs_cents = np.array([action["cost"] for action in actions], dtype=np.int64)
+    profit_scores = np.array(
+        [round(action["profit"] * 100) for action in actions], dtype=np.int32)
+
+    # Quantize the cost axis: when every cost (and the budget) shares a
+    # common divisor, the dp table shrinks by that factor.
+    step = int(np.gcd.reduce(np.append(costs_cents, budget_cents))) if len(actions) else 1
+    budget_q = budget_cents // step
+    costs_q = costs_cents // step
+
+    if NUMBA_AVAILABLE:
+        dp, choices = _knapsack_kernel(costs_q, profit_scores, budget_q)
+    else:
+        dp = np.zeros(budget_q + 1, dtype=np.int32)
+        # One packed bit row of take/leave flags per action: flagging a
+        # cell is O(1) where copying a name list per improved cell was
+        # O(budget) each time, and packing moves 8 cells per byte.
+        choices = np.zeros((len(actions), (budget_q >> 3) + 1), dtype=np.uint8)
+
+        for idx in range(len(actions)):
+            cost_q = int(costs_q[idx])
+            profit_score = np.int32(profit_scores[idx])
+            if cost_q > budget_q:
+                continue
+            # dp[w - cost] + profit for every w >= cost in one shot; the
+            # candidate array snapshots the pre-update dp, which is exactly
+            # what the backward scalar loop read.
+            candidates = dp[:budget_q - cost_q + 1] + profit_score
+            cells = dp[cost_q:]
+            better = candidates > cells
+            cells[better] = candidates[better]
+            improved = np.nonzero(better)[0] + cost_q
+            np.bitwise_or.at(choices[idx], improved >> 3,
+                             (np.uint8(1) << (improved & 7)).astype(np.uint8))
+
+    # Walk the packed choice rows backwards to rebuild the winning selection
+    selected_names = []
+    w = budget_q
+    for idx in range(len(actions) - 1, -1, -1):
+        if choices[idx, w >> 3] & (1 << (w & 7)):
+            selected_names.append(actions[idx]["name"])
+            w -= int(costs_q[idx])
+    selected_names.reverse()
+    selected_set = set(selected_names)
+    total_cost = sum(a["cost"] / 100 for a in actions if a["name"] in selected_set)
+    total_profit = float(dp[budget_q]) / 100
 
     return selected_names, total_cost, total_profit
 
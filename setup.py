@@ -0,0 +1,19 @@
+"""Build the optional C accelerator: python setup.py build_ext --inplace"""
+
+import numpy
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+extensions = [
+    Extension(
+        "_chunk_ext",
+        ["_chunk_ext.pyx"],
+        include_dirs=[numpy.get_include()],
+        extra_compile_args=["-O3", "-mavx2"],
+    )
+]
+
+setup(
+    name="ocr7-chunk-ext",
+    ext_modules=cythonize(extensions, language_level="3"),
+)